@@ -9,16 +9,18 @@ files, which run the actual experiments.
 """
 
 import hashlib
-import inspect
+import itertools
 import os
+import shlex
+import signal
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from os import listdir, makedirs
-from os.path import abspath, dirname, isdir, isfile, join
+from os import makedirs
+from os.path import abspath, isdir, isfile, join
 from pathlib import Path
 
-import tomllib
-
 
 class Colors:
     """Colors to be used when printing to the console."""
@@ -32,33 +34,83 @@ class Colors:
     END = "\033[0m"
 
 
+# Stores the output of the build that runs on the current worker thread, if any,
+# to print the output of concurrent builds as one block each.
+job_output = threading.local()
+
+# Stores the processes started by concurrent builds to terminate them once one of
+# the builds fails.
+job_processes = set()
+job_processes_lock = threading.Lock()
+jobs_aborted = threading.Event()
+
+
 def log(msg="", clean=False):
     """Writes a message (optional: with removed leading indentation) to the console."""
 
     if clean:
-        print(inspect.cleandoc(msg))
-    else:
+        import inspect
+
+        msg = inspect.cleandoc(msg)
+
+    lines = getattr(job_output, "lines", None)
+    if lines is None:
         print(msg)
+    else:
+        lines.append(msg)
 
 
 def err(msg):
     """Writes an error message to the console and halts the program."""
 
-    print(f"{Colors.FAIL}{msg.replace(Colors.END, Colors.FAIL)}{Colors.END}")
+    log(f"{Colors.FAIL}{msg.replace(Colors.END, Colors.FAIL)}{Colors.END}")
     exit(1)
 
 
-def exec(cmd):
-    """Executes a command and halts the program if the command fails."""
+def exec(cmd, shell=False):
+    """Executes a command and halts the program if the command fails.
+
+    The command is split into arguments and executed directly, unless shell is set. Then it is
+    executed through bash, which only the cmake configure call and git clone do, such that the
+    compile flags and the Git URL from the configuration can use shell expansions (e.g. $HOME).
+    """
+
+    log(f"  $ {Colors.CMD}{cmd}{Colors.END}")
+
+    # Run the commands of concurrent builds in their own session, such that all of
+    # their processes can be terminated together when another build fails.
+    concurrent = getattr(job_output, "lines", None) is not None
+    try:
+        with job_processes_lock:
+            if jobs_aborted.is_set():
+                exit(1)
+
+            process = subprocess.Popen(
+                ["bash", "-c", cmd] if shell else shlex.split(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+                errors="replace",
+                start_new_session=concurrent,
+            )
+            if concurrent:
+                job_processes.add(process)
+    except OSError as e:
+        err(f"  `-- Failed to execute command: {e}\n")
+
+    with process:
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            log(f"  | {line}")
 
-    print(f"  $ {Colors.CMD}{cmd}{Colors.END}")
-    full_cmd = f"{cmd} 2>&1 | sed 's/^/  | /'; exit ${{PIPESTATUS[0]}}"
-    result = subprocess.run(["bash", "-c", full_cmd], text=True)
+    with job_processes_lock:
+        job_processes.discard(process)
 
-    if result.returncode == 0:
-        print("  `-- Exit code: 0\n")
+    if process.returncode == 0:
+        log("  `-- Exit code: 0\n")
     else:
-        err("  `-- Exit code: " + str(result.returncode) + "\n")
+        err("  `-- Exit code: " + str(process.returncode) + "\n")
 
 
 def fetch_check_value(data, key, type):
@@ -67,9 +119,7 @@ def fetch_check_value(data, key, type):
     if key not in data or not isinstance(data[key], type):
         err(f"Unexpected value type for key {key}!")
 
-    value = data[key]
-    del data[key]
-    return value
+    return data.pop(key)
 
 
 def fetch_check_values(data, key, type):
@@ -78,9 +128,7 @@ def fetch_check_values(data, key, type):
     if key not in data or not all(isinstance(value, type) for value in data[key]):
         err(f"Unexpected value type for key {key}!")
 
-    value = data[key]
-    del data[key]
-    return value
+    return data.pop(key)
 
 
 def fetch_or_default(data, key, default, type):
@@ -92,21 +140,20 @@ def fetch_or_default(data, key, default, type):
     if not isinstance(data[key], type):
         err(f"Unexpected value type for key {key}!")
 
-    value = data[key]
-    del data[key]
-    return value
+    return data.pop(key)
 
 
 def hash(*args):
-    """Creates a MD5-hash of a single or multiple strings."""
+    """Creates a BLAKE2b-hash of a single or multiple strings."""
 
-    m = hashlib.md5()
+    m = hashlib.blake2b(digest_size=16)
     for arg in args:
-        if isinstance(arg, list):
-            for aarg in arg:
-                m.update(hashlib.md5(aarg.encode("utf-8")).digest())
-        else:
-            m.update(hashlib.md5(arg.encode("utf-8")).digest())
+        for aarg in arg if isinstance(arg, list) else [arg]:
+            # Prefix each string with its length so that different splits of the
+            # same characters (e.g. ["a", "bc"] and ["ab", "c"]) do not collide.
+            data = aarg.encode("utf-8")
+            m.update(len(data).to_bytes(4, "little"))
+            m.update(data)
     return m.hexdigest()
 
 
@@ -128,15 +175,17 @@ class System(str, Enum):
     def generate_wrapper(system, cmd, spack_env):
         """Wraps a command that is used to invoke a KaMinPar experiment."""
 
-        match system:
-            case System.GENERIC:
-                return f"bash {cmd}"
-            case System.BACKGROUND:
-                return f"nohup bash -- {cmd} &\ndisown"
-            case System.SPACK:
-                return f"spack env activate {spack_env}\nbash {cmd}"
-            case _:
-                err(f"Unexpected system {system}.")
+        if system not in _SYSTEM_WRAPPERS:
+            err(f"Unexpected system {system}.")
+
+        return _SYSTEM_WRAPPERS[system](cmd, spack_env)
+
+
+_SYSTEM_WRAPPERS = {
+    System.GENERIC: lambda cmd, spack_env: f"bash {cmd}",
+    System.BACKGROUND: lambda cmd, spack_env: f"nohup bash -- {cmd} &\ndisown",
+    System.SPACK: lambda cmd, spack_env: f"spack env activate {spack_env}\nbash {cmd}",
+}
 
 
 class CallWrapper(str, Enum):
@@ -150,17 +199,24 @@ class CallWrapper(str, Enum):
     def generate_wrapper(call_wrapper, num_processes, num_threads, cmd):
         """Wraps a command that is used to invoke a KaMinPar algorithm."""
 
-        match call_wrapper:
-            case CallWrapper.NONE:
-                return cmd
-            case CallWrapper.PERF:
-                return f"perf stat -d -d -d {cmd}"
-            case CallWrapper.TASKSET:
-                return f"taskset -c 0-{num_threads - 1} {cmd}"
-            case CallWrapper.MPI:
-                return f"mpirun -n {num_processes} --bind-to core --map-by socket:PE={num_threads} {cmd}"
-            case _:
-                err(f"Unexpected call wrapper {call_wrapper}.")
+        if call_wrapper not in _CALL_WRAPPERS:
+            err(f"Unexpected call wrapper {call_wrapper}.")
+
+        return _CALL_WRAPPERS[call_wrapper](num_processes, num_threads, cmd)
+
+
+_CALL_WRAPPERS = {
+    CallWrapper.NONE: lambda num_processes, num_threads, cmd: cmd,
+    CallWrapper.PERF: lambda num_processes, num_threads, cmd: (
+        f"perf stat -d -d -d {cmd}"
+    ),
+    CallWrapper.TASKSET: lambda num_processes, num_threads, cmd: (
+        f"taskset -c 0-{num_threads - 1} {cmd}"
+    ),
+    CallWrapper.MPI: lambda num_processes, num_threads, cmd: (
+        f"mpirun -n {num_processes} --bind-to core --map-by socket:PE={num_threads} {cmd}"
+    ),
+}
 
 
 class Experiment:
@@ -183,57 +239,61 @@ class Experiment:
                 f"Directory {Colors.FILE}{graphs_path}{Colors.END} that stores the graphs for experiment {Colors.EXP}{name}{Colors.END} does not exist!"
             )
 
-        self.graphs = [
-            abspath(join(graphs_path, file))
-            for file in listdir(graphs_path)
-            if isfile(join(graphs_path, file))
-        ]
+        with os.scandir(graphs_path) as entries:
+            self.graphs = sorted(
+                abspath(entry.path) for entry in entries if entry.is_file()
+            )
         if not self.graphs:
             err(f"Directory {Colors.FILE}{graphs_path}{Colors.END} stores no graphs!")
-        else:
-            self.graphs.sort()
+
+        # Stores the file names of the graphs without extension, which are part of the log file names.
+        self.graph_stems = [Path(graph).stem for graph in self.graphs]
+
+        self.algorithms = []
+        for algo_name, algo_config in config.items():
+            if not isinstance(algo_config, dict):
+                err(
+                    f"Unexpected configuration for algorithm {Colors.ALGO}{algo_name}{Colors.END} of experiment {Colors.EXP}{name}{Colors.END}!"
+                )
+
+            # Reuse the algorithm if another experiment defines it identically. Since
+            # creating an algorithm consumes its configuration, pass a copy instead.
+            key = hash(algo_name, repr(sorted(algo_config.items())))
+            if key not in created_algorithms:
+                created_algorithms[key] = Algorithm(algo_name, dict(algo_config))
+            self.algorithms.append(created_algorithms[key])
 
     def generate(self):
         """Generates a script file that when invoked runs this experiment."""
 
+        # Create the script directory once; the script of each algorithm is placed inside it.
+        makedirs(f"./scripts/{self.name}", exist_ok=True)
         starter_name = f"./scripts/{self.name}/starter.sh"
-        makedirs(dirname(starter_name), exist_ok=True)
 
         with open(starter_name, "w") as starter:
             print("#!/usr/bin/env bash", file=starter)
-            for algo_name, algo_config in self.config.items():
-                if not isinstance(algo_config, dict):
-                    err(
-                        f"Unexpected configuration for algorithm {Colors.ALGO}{algo_name}{Colors.END} of experiment {Colors.EXP}{self.name}{Colors.END}!"
-                    )
-
-                script_path = self.generate_algorithm(algo_name, algo_config)
+            for algorithm in self.algorithms:
+                script_path = self.generate_algorithm(algorithm)
                 print(f"bash {script_path}", file=starter)
 
         make_executable(starter_name)
         return abspath(starter_name)
 
-    def generate_algorithm(self, algo_name, algo_config):
+    def generate_algorithm(self, algorithm):
         """Generates a script file that when invoked runs an algorithm of this experiment."""
 
-        algorithm = Algorithm(algo_name, algo_config)
-        if algorithm.hash in generated_sources:
-            log(
-                f"Algorithm {Colors.ALGO}{algo_name}{Colors.END} has been already build: skipping fetch & build"
-            )
-        else:
-            generated_sources.add(algorithm.hash)
-            algorithm.fetch()
-            algorithm.build()
+        algo_name = algorithm.name
+        bin_path = algorithm.binary_path()
+        heap_profiled = algorithm.heap_profiled()
 
         num_graphs = len(self.graphs)
         nl = "\n                "  # Cannot explicitly use backslash in f-string; therefore use this workaround
         log(
             f"""
             Generating calls for algorithm {Colors.ALGO}{algo_name}{Colors.END} using:
-            - Binary: {Colors.FILE}{algorithm.binary_path()}{Colors.END}
+            - Binary: {Colors.FILE}{bin_path}{Colors.END}
             - Generated arguments:
-                -T {nl + "-H" if algorithm.heap_profiled() else ""}
+                -T {nl + "-H" if heap_profiled else ""}
                 -G {Colors.ARGS}[{self.graphs[0] if num_graphs == 1 else " ... ".join(self.graphs[::num_graphs - 1])}]{Colors.END}
                 -t {Colors.ARGS}{self.threads}{Colors.END}
                 -k {Colors.ARGS}{self.ks}{Colors.END}
@@ -251,47 +311,71 @@ class Experiment:
         log()
 
         script_name = f"./scripts/{self.name}/{algo_name}.sh"
-        makedirs(dirname(script_name), exist_ok=True)
 
-        log_dir = f"./logs/{self.name}/{algo_name}"
+        log_dir = abspath(f"./logs/{self.name}/{algo_name}")
         makedirs(log_dir, exist_ok=True)
 
-        with open(script_name, "w") as script:
-            print("#!/usr/bin/env bash", file=script)
-            for graph in self.graphs:
-                for num_processes in self.processes:
-                    for num_threads in self.threads:
-                        for k in self.ks:
-                            for epsilon in self.epsilons:
-                                for seed in self.seeds:
-                                    generated_arguments = f"-T -G {graph} -t {num_threads} -k {k} -e {epsilon} -s {seed}"
-                                    if algorithm.heap_profiled():
-                                        generated_arguments = (
-                                            f"-H {generated_arguments}"
-                                        )
-
-                                    specified_arguments = " ".join(algorithm.args)
-                                    if str(k) in algorithm.per_k_args:
-                                        per_k_args = algorithm.per_k_args[str(k)]
-                                        if per_k_args:
-                                            specified_arguments += " "
-                                            specified_arguments += " ".join(per_k_args)
-
-                                    log_file = abspath(
-                                        f"{log_dir}/{Path(graph).stem}___P1x{num_processes}x{num_threads}_seed{seed}_eps{epsilon}_k{k}.log"
-                                    )
-                                    cmd = f"{algorithm.binary_path()} {generated_arguments} {specified_arguments} >> {log_file} 2>&1"
-
-                                    cmd = CallWrapper.generate_wrapper(
-                                        call_wrapper, num_processes, num_threads, cmd
-                                    )
-                                    if self.timeout > 0:
-                                        cmd = f"timeout -v {self.timeout}m {cmd}"
-                                    if time_cmd:
-                                        cmd = f"{time_cmd} -v {cmd}"
-
-                                    commands.append((graph, cmd))
-                                    print(cmd, file=script)
+        heap_prefix = "-H " if heap_profiled else ""
+        specified_arguments = " ".join(algorithm.args)
+        arguments_per_k = {}
+        for k in map(str, self.ks):
+            arguments_per_k[k] = specified_arguments
+            per_k_args = algorithm.per_k_args.get(k)
+            if per_k_args:
+                arguments_per_k[k] += " " + " ".join(per_k_args)
+        timeout_prefix = f"timeout -v {self.timeout}m " if self.timeout > 0 else ""
+        time_prefix = f"{time_cmd} -v " if time_cmd else ""
+
+        # The call wrappers only prepend to the command, thus wrap the binary path
+        # once for each combination of processes and threads.
+        launchers = {
+            (str(num_processes), str(num_threads)): time_prefix
+            + timeout_prefix
+            + CallWrapper.generate_wrapper(
+                call_wrapper, num_processes, num_threads, bin_path
+            )
+            for num_processes in self.processes
+            for num_threads in self.threads
+        }
+
+        # Specialize a template for each combination of processes, threads and k, so
+        # that only the graph, epsilon and seed remain to be filled in per call. The
+        # fixed parts are escaped since they may contain percent signs themselves.
+        escaped_log_dir = log_dir.replace("%", "%%")
+        templates = []
+        for num_processes, num_threads, k in itertools.product(
+            map(str, self.processes), map(str, self.threads), map(str, self.ks)
+        ):
+            launcher = launchers[num_processes, num_threads].replace("%", "%%")
+            arguments = arguments_per_k[k].replace("%", "%%")
+            templates.append(
+                f"{launcher} {heap_prefix}-T -G %s -t {num_threads} -k {k} -e %s -s %s {arguments} >> {escaped_log_dir}/%s___P1x{num_processes}x{num_threads}_seed%s_eps%s_k{k}.log 2>&1\n"
+            )
+
+        parameters = [
+            (template, epsilon, seed)
+            for template in templates
+            for epsilon in map(str, self.epsilons)
+            for seed in map(str, self.seeds)
+        ]
+
+        # Join the calls of each graph into a single chunk, which is shared by the
+        # script of this algorithm and the script with all calls ordered by graph.
+        chunks = []
+        for graph, graph_stem in zip(self.graphs, self.graph_stems):
+            chunk = "".join(
+                [
+                    template % (graph, epsilon, seed, graph_stem, seed, epsilon)
+                    for template, epsilon, seed in parameters
+                ]
+            )
+
+            commands.setdefault(graph, []).append(chunk)
+            chunks.append(chunk)
+
+        with open(script_name, "w", buffering=1 << 20) as script:
+            script.write("#!/usr/bin/env bash\n")
+            script.writelines(chunks)
 
         make_executable(script_name)
         return abspath(script_name)
@@ -308,19 +392,31 @@ class Algorithm:
         self.branch = fetch_or_default(config, "branch", "main", str)
         self.target = fetch_or_default(config, "target", "KaMinPar", str)
         self.compile_flags = fetch_check_values(config, "compile-flags", str)
+        self._compile_flags_set = frozenset(self.compile_flags)
         self.args = fetch_check_values(config, "args", str)
         self.per_k_args = fetch_or_default(config, "per-k-args", {}, dict)
 
         self.hash = hash(self.git_url, self.branch, self.compile_flags)
         self.src_dir = abspath(f"./src/{self.hash}")
+        self.built_marker = join(self.src_dir, ".kmpexp-built")
+
+        # Use fixed length of the hash value as an indicator of a detached head, which can result in false positives.
+        self.detached_head = len(self.branch) == 40
 
     def fetch(self):
         """Fetches the source files of this KaMinPar algorithm."""
 
-        # Use fixed length of the hash value as an indicator of a detached head, which can result in false positives.
-        detached_head = len(self.branch) == 40
-
-        if detached_head and isdir(self.src_dir):
+        # The sources are about to change, thus invalidate a previous build.
+        if isfile(self.built_marker):
+            os.remove(self.built_marker)
+
+        # Only skip the fetch if the pinned commit has been checked out, as a previous
+        # fetch might have been interrupted before the checkout.
+        if (
+            self.detached_head
+            and isdir(self.src_dir)
+            and self.checked_out_commit() == self.branch.lower()
+        ):
             log(
                 f"Directory {Colors.FILE}{self.src_dir}{Colors.END} for algorithm {Colors.ALGO}{self.name}{Colors.END} is in detached head: skipping fetch"
             )
@@ -329,7 +425,10 @@ class Algorithm:
             log(
                 f"Directory {Colors.FILE}{self.src_dir}{Colors.END} for algorithm {Colors.ALGO}{self.name}{Colors.END} does not exist: initialize from a remote Git repository"
             )
-            exec(f"git clone --recurse-submodules {self.git_url} {self.src_dir}")
+            exec(
+                f"git clone --recurse-submodules {self.git_url} {self.src_dir}",
+                shell=True,
+            )
         else:
             log(
                 f"Directory {Colors.FILE}{self.src_dir}{Colors.END} for algorithm {Colors.ALGO}{self.name}{Colors.END} does already exist: update from a remote Git repository"
@@ -341,16 +440,49 @@ class Algorithm:
             f"git -C {self.src_dir} -c advice.detachedHead=false checkout {self.branch}"
         )
 
-    def build(self):
-        """Builds this KaMinPar algorithm that was previously fetched."""
+    def build(self, jobs=None):
+        """Builds this KaMinPar algorithm that was previously fetched (optional: with a limited number of parallel jobs)."""
 
         log(
             f"Build algorithm {Colors.ALGO}{self.name}{Colors.END} in directory {Colors.FILE}{self.src_dir}{Colors.END}"
         )
+        # Run through bash, such that the compile flags can use shell expansions (e.g. $HOME).
         exec(
-            f"cmake -S {self.src_dir} -B {self.src_dir}/build -DCMAKE_BUILD_TYPE=Release -DKAMINPAR_BUILD_DISTRIBUTED=On -DKAMINPAR_BUILD_TESTS=Off -DKAMINPAR_BUILD_BENCHMARKS=On {' '.join(self.compile_flags)}"
+            f"cmake -S {self.src_dir} -B {self.src_dir}/build -DCMAKE_BUILD_TYPE=Release -DKAMINPAR_BUILD_DISTRIBUTED=On -DKAMINPAR_BUILD_TESTS=Off -DKAMINPAR_BUILD_BENCHMARKS=On {' '.join(self.compile_flags)}",
+            shell=True,
+        )
+        parallel = f"--parallel {jobs}" if jobs else "--parallel"
+        exec(f"cmake --build {self.src_dir}/build --target {self.target} {parallel}")
+
+        # Record from which commit the binary has been built, such that a source
+        # directory that is not at the pinned commit is never trusted. The target is
+        # not part of the hash, thus record which target has been built as well.
+        with open(self.built_marker, "w") as marker:
+            marker.write(f"{self.checked_out_commit()} {self.target}")
+
+    def is_built(self):
+        """Returns whether this KaMinPar algorithm is pinned to a commit and has been successfully built by a previous run."""
+
+        # Algorithms that follow a branch are updated and rebuilt on every run.
+        if not self.detached_head or not isfile(self.built_marker):
+            return False
+
+        with open(self.built_marker) as marker:
+            if marker.read().split() != [self.branch.lower(), self.target]:
+                return False
+
+        return isfile(self.binary_path())
+
+    def checked_out_commit(self):
+        """Returns the commit that is checked out in the source directory of this KaMinPar algorithm."""
+
+        result = subprocess.run(
+            ["git", "-C", self.src_dir, "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
         )
-        exec(f"cmake --build {self.src_dir}/build --target {self.target} --parallel")
+        return result.stdout.strip() if result.returncode == 0 else ""
 
     def binary_path(self):
         """Returns the binary path of the result of previously building this KaMinPar algorithm."""
@@ -366,13 +498,94 @@ class Algorithm:
     def heap_profiled(self):
         """Returns whether the heap profiler is enabled for this KaMinPar algorithm."""
 
-        return "-DKAMINPAR_ENABLE_HEAP_PROFILING=On" in self.compile_flags
+        return "-DKAMINPAR_ENABLE_HEAP_PROFILING=On" in self._compile_flags_set
+
+
+def prepare_algorithms(algorithms):
+    """Fetches the source files of several KaMinPar algorithms one after another and builds them concurrently."""
+
+    # Only fetch and build each source directory once. Since the algorithms to
+    # prepare are selected up front, the worker threads share no state.
+    pending = []
+    duplicates = []
+    for algorithm in algorithms:
+        if algorithm.hash in generated_sources:
+            duplicates.append(algorithm)
+        elif algorithm.is_built():
+            generated_sources.add(algorithm.hash)
+            log(
+                f"Algorithm {Colors.ALGO}{algorithm.name}{Colors.END} has been already build by a previous run: skipping fetch & build"
+            )
+        else:
+            generated_sources.add(algorithm.hash)
+            pending.append(algorithm)
+
+    # Fetch on the main thread, such that Git can prompt for credentials on the
+    # terminal and a fetch is never terminated halfway by a failing build.
+    for algorithm in pending:
+        algorithm.fetch()
+
+    # Split the available cores between the concurrent builds, which would
+    # otherwise each use all cores.
+    num_cores = os.cpu_count() or 1
+    num_workers = min(len(pending), num_cores)
+    if num_workers <= 1:
+        for algorithm in pending:
+            algorithm.build()
+    else:
+        num_build_jobs = num_cores // num_workers
+        output_lock = threading.Lock()
+
+        def build(algorithm):
+            with output_lock:
+                log(
+                    f"Build algorithm {Colors.ALGO}{algorithm.name}{Colors.END} in the background: output follows once the build is finished"
+                )
+
+            job_output.lines = []
+            try:
+                algorithm.build(num_build_jobs)
+            finally:
+                # Builds that are terminated because another build failed stay silent.
+                lines = job_output.lines
+                del job_output.lines
+                if not jobs_aborted.is_set():
+                    with output_lock:
+                        log("\n".join(lines))
+
+        def abort():
+            with job_processes_lock:
+                jobs_aborted.set()
+                for process in job_processes:
+                    try:
+                        os.killpg(process.pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+        try:
+            futures = [executor.submit(build, algorithm) for algorithm in pending]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            abort()
+            raise
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    for algorithm in duplicates:
+        log(
+            f"Algorithm {Colors.ALGO}{algorithm.name}{Colors.END} has been already build: skipping fetch & build"
+        )
 
 
 if not isfile("Experiment.toml"):
     err("The current directory does not contain an experiment configuration file.")
 
 with open("Experiment.toml", "rb") as file:
+    # Import tomllib only once we know that there is a configuration file to parse.
+    import tomllib
+
     data = tomllib.load(file)
 
     system = fetch_or_default(data, "system", System.GENERIC, str)
@@ -389,9 +602,27 @@ with open("Experiment.toml", "rb") as file:
     # fetch and build source files once.
     generated_sources = set()
 
-    # Stores the commands that are generated together with the input graph to
-    # create a script with all input graphs in sorted order.
-    commands = list()
+    # Stores the algorithms that are created by a hash value of their name and
+    # configuration to only create identically defined algorithms once.
+    created_algorithms = dict()
+
+    # Stores the commands that are generated grouped by their input graph, as one
+    # chunk of lines per algorithm, to create a script with all input graphs in
+    # sorted order.
+    commands = dict()
+
+    experiments = []
+    for name, config in data.items():
+        if not isinstance(config, dict):
+            err(
+                f"Unexpected configuration for experiment {Colors.EXP}{name}{Colors.END}!"
+            )
+
+        experiments.append(Experiment(name, config))
+
+    prepare_algorithms(
+        [algorithm for experiment in experiments for algorithm in experiment.algorithms]
+    )
 
     # Generate all experiments and add their starting script to the submission script.
     submit_name = "./submit.sh"
@@ -399,13 +630,7 @@ with open("Experiment.toml", "rb") as file:
         print("#!/usr/bin/env bash", file=submit)
         print(f"cd {os.getcwd()}", file=submit)
 
-        for name, config in data.items():
-            if not isinstance(config, dict):
-                err(
-                    f"Unexpected configuration for experiment {Colors.EXP}{name}{Colors.END}!"
-                )
-
-            experiment = Experiment(name, config)
+        for experiment in experiments:
             script_name = experiment.generate()
 
             print(System.generate_wrapper(system, script_name, spack_env), file=submit)
@@ -413,7 +638,6 @@ with open("Experiment.toml", "rb") as file:
 
     # Generate a submission script that runs all commands by input graphs in
     # alphabetical order.
-    commands.sort(key=lambda x: x[0])
     submit_all_name = "./submit-ordered.sh"
     starter_all_name = "./scripts/ordered-starter.sh"
     with open(submit_all_name, "w") as submit_all:
@@ -424,9 +648,9 @@ with open("Experiment.toml", "rb") as file:
             file=submit_all,
         )
 
-        with open(starter_all_name, "w") as starter_all:
+        with open(starter_all_name, "w", buffering=1 << 20) as starter_all:
             print("#!/usr/bin/env bash", file=starter_all)
 
-            for _, cmd in commands:
-                print(cmd, file=starter_all)
+            for graph in sorted(commands):
+                starter_all.writelines(commands[graph])
     make_executable(submit_all_name)